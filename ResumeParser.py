@@ -1,24 +1,122 @@
 import os
-from openai import OpenAI
+import asyncio
+import threading
+from collections import OrderedDict
+from functools import cache, lru_cache
+from pathlib import Path
+import httpx
+from openai import AsyncOpenAI
 from langgraph.graph import StateGraph, START, END
 from text_extractor import extract_data
+from llm_cache import LLMResponseCache
+from typing import Optional
 from typing_extensions import TypedDict
 import json
+import logging
+import re
+import orjson
+
+logger = logging.getLogger(__name__)
 
 # -------------------------------------------------
 # OpenRouter Client
 # -------------------------------------------------
-client = OpenAI(
-    base_url="https://openrouter.ai/api/v1",
-    api_key="sk-xxx",  
-)
+# One pooled HTTP/2 client shared by every request so batch calls multiplex
+# over a few kept-alive connections instead of opening new ones. Both clients
+# are built on first use and rebuilt after close_client(), so a server
+# shutdown does not leave later callers with a closed client. Pooled
+# connections belong to the loop that opened them, so a new event loop (e.g.
+# a second asyncio.run) also gets fresh clients.
+_http_client = None
+_client = None
+_client_loop = None
+
+def get_client():
+    global _http_client, _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _http_client.is_closed or _client_loop is not loop:
+        _client_loop = loop
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=60.0
+        )
+        _client = AsyncOpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key="sk-xxx",  
+            http_client=_http_client
+        )
+    return _client
+
+async def close_client():
+    global _http_client, _client, _client_loop
+    http_client, _http_client, _client, _client_loop = _http_client, None, None, None
+    if http_client is not None:
+        await http_client.aclose()
 
 # -------------------------------------------------
 # System Prompt (unchanged)
 # -------------------------------------------------
-CANDIDATE_PROMPT = open("candidate_json.txt", "r").read()
-JD_PROMPT = open("jd_json.txt", "r").read()
-GRADING_PROMPT = open("grading.txt", "r",  encoding="utf-8").read()
+CANDIDATE_PROMPT_FILE = "candidate_json.txt"
+JD_PROMPT_FILE = "jd_json.txt"
+GRADING_PROMPT_FILE = "grading.txt"
+
+@cache
+def _load(path):
+    # read on first use and keep the text for the life of the process
+    return Path(path).read_text(encoding="utf-8")
+
+# -------------------------------------------------
+# LLM RESPONSE CACHE
+# -------------------------------------------------
+LLM_MODEL = "gpt-oss-20b"
+
+# created on first use so importing the module never touches ./llm_cache/
+_llm_cache_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _open_llm_cache():
+    return LLMResponseCache()
+
+def get_llm_cache():
+    with _llm_cache_lock:
+        return _open_llm_cache()
+
+def _llm_cache_get(key):
+    return get_llm_cache().get(key)
+
+def _llm_cache_set(key, content):
+    get_llm_cache().set(key, content)
+
+async def _complete_json(system_prompt: str, user_content: str) -> str:
+    """Return the JSON-mode completion for a prompt, reusing cached responses."""
+    key = LLMResponseCache.key(LLM_MODEL, system_prompt, user_content)
+    # SQLite I/O runs on a worker thread so it never stalls the event loop
+    cached = await asyncio.to_thread(_llm_cache_get, key)
+    if cached is not None:
+        return cached
+
+    response = await get_client().chat.completions.create(
+        model=LLM_MODEL,
+        messages=[
+            # the system prompts are static, so mark them as a cacheable
+            # prefix for providers that support OpenRouter prompt caching
+            {"role": "system", "content": [
+                {"type": "text", "text": system_prompt,
+                 "cache_control": {"type": "ephemeral"}}
+            ]},
+            {"role": "user", "content": user_content}
+        ],
+        response_format={"type": "json_object"}
+    )
+    content = response.choices[0].message.content
+    # only keep responses that parse, so a bad completion gets retried
+    try:
+        orjson.loads(content)
+    except (TypeError, ValueError):
+        return content
+    await asyncio.to_thread(_llm_cache_set, key, content)
+    return content
 
 # -------------------------------------------------
 # STATE
@@ -33,13 +131,83 @@ class State(TypedDict):
     experience_score: float
     education_score: float
     skill_match_score: dict
+    semantic_skill_score: Optional[float]  # only set when SEMANTIC_SKILL_SCORE=1
     final_match_score: float
 
 # -------------------------------------------------
 # EMBEDDING MODEL
 # -------------------------------------------------
-from sentence_transformers import SentenceTransformer, util
-model = SentenceTransformer("all-MiniLM-L6-v2")
+# The model is loaded on first use rather than at import so API workers that
+# never embed skip the load. Behaviour can be tuned through the environment:
+#   EMBEDDING_PRECISION   auto (default), fp32, fp16 or qint8
+#   EMBEDDING_NUM_THREADS torch intra-op threads, e.g. 1 behind async workers
+#   SEMANTIC_SKILL_SCORE  set to 1 to report an embedding-based skill overlap
+#                         next to the scores; off by default, so nothing embeds
+from embedding_cache import TextEmbeddingCache
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+EMBEDDING_PRECISIONS = ("auto", "fp32", "fp16", "qint8")
+# checked at import so a typo stops startup instead of failing quietly on the
+# first embedding call
+EMBEDDING_PRECISION = os.getenv("EMBEDDING_PRECISION", "auto").lower()
+if EMBEDDING_PRECISION not in EMBEDDING_PRECISIONS:
+    raise ValueError(
+        f"EMBEDDING_PRECISION must be one of {', '.join(EMBEDDING_PRECISIONS)}, got {EMBEDDING_PRECISION!r}"
+    )
+SEMANTIC_SKILL_SCORE_ENABLED = os.getenv("SEMANTIC_SKILL_SCORE", "0") == "1"
+
+@lru_cache(maxsize=1)
+def get_embedder():
+    """Load the SentenceTransformer once; returns the model and its precision tag."""
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    num_threads = os.getenv("EMBEDDING_NUM_THREADS")
+    if num_threads:
+        torch.set_num_threads(int(num_threads))
+
+    precision = EMBEDDING_PRECISION
+    has_cuda = torch.cuda.is_available()
+    if precision == "auto":
+        # FP16 on GPU, dynamic int8 Linear layers on CPU
+        precision = "fp16" if has_cuda else "qint8"
+    elif precision == "fp16" and not has_cuda:
+        # half precision is a GPU optimisation; stay in FP32 on CPU
+        precision = "fp32"
+    # dynamic quantization only has CPU kernels
+    device = "cuda" if has_cuda and precision != "qint8" else "cpu"
+
+    model = SentenceTransformer(EMBEDDING_MODEL_NAME, device=device)
+    if precision == "fp16":
+        model = model.half()
+    elif precision == "qint8":
+        model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return model, precision
+
+# serialises the first load when several worker threads embed at once
+_embedder_lock = threading.Lock()
+# lru_cache does not cache exceptions, so remember a failed load here rather
+# than retrying the full model load under the lock on every request
+_embedder_error = None
+
+def _load_embedding_cache():
+    global _embedder_error
+    with _embedder_lock:
+        if _embedder_error is not None:
+            raise RuntimeError("embedding model failed to load") from _embedder_error
+        try:
+            return get_embedding_cache()
+        except Exception as e:
+            _embedder_error = e
+            logger.exception("Loading the embedding model failed; semantic scores are disabled")
+            raise
+
+@lru_cache(maxsize=1)
+def get_embedding_cache():
+    model, precision = get_embedder()
+    # the precision tag keeps vectors from different variants apart
+    return TextEmbeddingCache(model, f"{EMBEDDING_MODEL_NAME}:{precision}")
 
 # -------------------------------------------------
 # HELPER FUNCTIONS
@@ -52,43 +220,55 @@ def compute_semantic_score(list1, list2):
     if not list1 or not list2:
         return 0.0
 
-    emb1 = model.encode(list1, convert_to_tensor=True)
-    emb2 = model.encode(list2, convert_to_tensor=True)
-    sim = util.cos_sim(emb1, emb2)
-    return float(sim.mean().item())
-
-def normalize_degree(text: str) -> str:
-    if not text:
-        return "unknown"
+    # one encode pass for both sides; unit-length rows make the dot
+    # product equal to cosine similarity
+    embedding_cache = _load_embedding_cache()
+    emb = embedding_cache.encode_cached(list(list1) + list(list2), normalize=True)
+    emb1, emb2 = emb[:len(list1)], emb[len(list1):]
+    sim = emb1 @ emb2.T
+    return float(sim.mean())
+
+BACHELOR_KEYWORDS = ("b.tech", "btech", "b tech", "b.e", "be", "bachelor")
+MASTER_KEYWORDS = ("m.tech", "mtech", "m tech", "m.e", "me", "master", "msc", "ms")
+PHD_KEYWORDS = ("phd", "ph.d", "doctor", "doctorate", "doctoral")
+RELEVANT_FIELDS = (
+    "computer", "cs", "cse", "it", "information technology",
+    "ai", "ml", "data", "data science", "ds",
+    "ece", "eee", "electronics", "csbs"
+)
 
-    t = text.lower()
-    if any(x in t for x in ["b.tech", "btech", "b tech", "b.e", "be", "bachelor"]):
+@lru_cache(maxsize=4096)
+def _normalize_degree_lower(t: str) -> str:
+    if any(x in t for x in BACHELOR_KEYWORDS):
         return "bachelor"
-    if any(x in t for x in ["m.tech", "mtech", "m tech", "m.e", "me", "master", "msc", "ms"]):
+    if any(x in t for x in MASTER_KEYWORDS):
         return "master"
-    if any(x in t for x in ["phd", "ph.d", "doctor", "doctorate", "doctoral"]):
+    if any(x in t for x in PHD_KEYWORDS):
         return "phd"
     if "diploma" in t:
         return "diploma"
 
     return "unknown"
 
-def compute_field_relevance(candidate_stream: str, jd_field_req: str) -> float:
-    if not jd_field_req or jd_field_req.strip() == "":
-        return 1.0
+def normalize_degree(text: str) -> str:
+    if not text:
+        return "unknown"
 
-    cand = (candidate_stream or "").lower()
-    jd = jd_field_req.lower()
-    RELEVANT_FIELDS = [
-        "computer", "cs", "cse", "it", "information technology",
-        "ai", "ml", "data", "data science", "ds",
-        "ece", "eee", "electronics", "csbs"
-    ]
+    return _normalize_degree_lower(text.lower())
+
+@lru_cache(maxsize=4096)
+def _field_relevance_lower(cand: str) -> float:
     if any(term in cand for term in RELEVANT_FIELDS):
         return 0.9
 
     return 0.5
 
+def compute_field_relevance(candidate_stream: str, jd_field_req: str) -> float:
+    if not jd_field_req or jd_field_req.strip() == "":
+        return 1.0
+
+    return _field_relevance_lower((candidate_stream or "").lower())
+
 def degree_match(candidate_degree, candidate_stream, jd_required):
     if not jd_required:
         return 1.0 
@@ -111,13 +291,15 @@ def degree_match(candidate_degree, candidate_stream, jd_required):
     return round(final, 3)
 
 
+_NON_DIGIT_RE = re.compile(r"\D+")
+
 def experience_match(candidate_exp_years, jd_exp):
     if not jd_exp:
         return 1.0
 
     try:
-        required = int("".join([c for c in jd_exp if c.isdigit()]))
-    except:
+        required = int(_NON_DIGIT_RE.sub("", jd_exp))
+    except (TypeError, ValueError):
         return 1.0
 
     if candidate_exp_years >= required:
@@ -126,12 +308,28 @@ def experience_match(candidate_exp_years, jd_exp):
         return 0.6
     return 0.2
 
+# experience type -> (bucket, fraction of the duration credited to it);
+# unrecognised types count half their duration as apprentice time
+EXPERIENCE_TYPES = {
+    "internship": ("internship", 1.0),
+    "apprentice": ("apprentice", 1.0),
+    "full time": ("industry", 1.0),
+    "part time": ("part_time", 1.0),
+    "free lance": ("freelance", 1.0),
+}
+UNKNOWN_EXPERIENCE_TYPE = ("apprentice", 0.5)
+
+# weight of a year in each bucket towards effective experience
+EXPERIENCE_WEIGHTS = {
+    "industry": 1.0,
+    "internship": 0.5,
+    "apprentice": 0.6,
+    "part_time": 0.4,
+    "freelance": 0.7,
+}
+
 def compute_experience_breakdown(candidate):
-    internship_months = 0
-    apprentice_months = 0
-    industry_months = 0
-    part_time_months = 0
-    freelance_months = 0
+    months = dict.fromkeys(EXPERIENCE_WEIGHTS, 0)
     if isinstance(candidate, dict):
         experiences = candidate.get("experience", [])
     elif isinstance(candidate, list):
@@ -139,68 +337,36 @@ def compute_experience_breakdown(candidate):
     else:
         experiences = []
     for exp in experiences:
-        months = exp.get("duration_months", 0)
         exp_type = (exp.get("type", "") or "").lower()
-        if exp_type == "internship":
-            internship_months += months
-        elif exp_type == "apprentice":
-            apprentice_months += months
-        elif exp_type == "full time":
-            industry_months += months
-        elif exp_type == "part time":
-            part_time_months += months
-        elif exp_type == "free lance":
-            freelance_months += months
-        else:
-            apprentice_months += 0.5 * months
-    internship_years = internship_months / 12
-    apprentice_years = apprentice_months / 12
-    industry_years = industry_months / 12
-    part_time_years = part_time_months / 12
-    freelance_years = freelance_months / 12
-    INTERNSHIP_WEIGHT = 0.5
-    APPRENTICE_WEIGHT = 0.6
-    PART_TIME_WEIGHT = 0.4
-    FREELANCE_WEIGHT = 0.7
-    effective_years = (
-          industry_years
-        + INTERNSHIP_WEIGHT * internship_years
-        + APPRENTICE_WEIGHT * apprentice_years
-        + PART_TIME_WEIGHT * part_time_years
-        + FREELANCE_WEIGHT * freelance_years
-    )
+        bucket, share = EXPERIENCE_TYPES.get(exp_type, UNKNOWN_EXPERIENCE_TYPE)
+        months[bucket] += share * exp.get("duration_months", 0)
+
+    years = {bucket: m / 12 for bucket, m in months.items()}
+    effective_years = sum(EXPERIENCE_WEIGHTS[bucket] * y for bucket, y in years.items())
     return {
-        "internship_years": round(internship_years, 2),
-        "apprentice_years": round(apprentice_years, 2),
-        "industry_years": round(industry_years, 2),
-        "part_time_years": round(part_time_years, 2),
-        "freelance_years": round(freelance_years, 2),
+        "internship_years": round(years["internship"], 2),
+        "apprentice_years": round(years["apprentice"], 2),
+        "industry_years": round(years["industry"], 2),
+        "part_time_years": round(years["part_time"], 2),
+        "freelance_years": round(years["freelance"], 2),
         "effective_years": round(effective_years, 2)
     }
 
 # -------------------------------------------------
 # NODE: Candidate Data Extraction
 # -------------------------------------------------
-def candidate_info_extraction(state: State):
+async def candidate_info_extraction(state: State):
 
     raw_text = state["raw_extracted_text"]
     links = state["links_info"]
     combined_input = (
         "RAW RESUME TEXT:\n\n" + raw_text +
         "\n\nEXTRACTED LINKS JSON:\n" +
-        json.dumps(links, indent=2)
-    )
-    response = client.chat.completions.create(
-        model="gpt-oss-20b",
-        messages=[
-            {"role": "system", "content": CANDIDATE_PROMPT},
-            {"role": "user", "content": combined_input}
-        ],
-        response_format={"type": "json_object"}
+        orjson.dumps(links, option=orjson.OPT_INDENT_2).decode()
     )
-    assistant_msg = response.choices[0].message.content
+    assistant_msg = await _complete_json(_load(CANDIDATE_PROMPT_FILE), combined_input)
     try:
-        parsed = json.loads(assistant_msg)
+        parsed = orjson.loads(assistant_msg)
     except:
         parsed = {
             "error": "Invalid JSON returned",
@@ -220,31 +386,51 @@ def candidate_info_extraction(state: State):
 # -------------------------------------------------
 # NODE: Job Description Data Extraction
 # -------------------------------------------------
-def job_desc_extraction(state: State):
-
-    job_desc = state["job_description"]
-    response = client.chat.completions.create(
-        model="gpt-oss-20b",
-        messages=[
-            {"role": "system", "content": JD_PROMPT},
-            {"role": "user", "content": job_desc}
-        ],
-        response_format={"type": "json_object"}
-    )
-    assistant_msg = response.choices[0].message.content
+async def _extract_job_info(job_desc: str):
+    assistant_msg = await _complete_json(_load(JD_PROMPT_FILE), job_desc)
     try:
-        parsed = json.loads(assistant_msg)
+        parsed = orjson.loads(assistant_msg)
     except:
         parsed = {
             "error": "Invalid JSON returned",
             "raw_output": assistant_msg
         }
+    return parsed
+
+# In-process memo of JD extractions. Entries are tasks rather than results so
+# that a batch scoring many resumes against one JD shares a single in-flight
+# call instead of every resume missing the cache at once.
+JD_MEMO_SIZE = 256
+_jd_memo = OrderedDict()
+
+async def job_desc_extraction(state: State):
+
+    job_desc = state["job_description"]
+    task = _jd_memo.get(job_desc)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_extract_job_info(job_desc))
+        _jd_memo[job_desc] = task
+        if len(_jd_memo) > JD_MEMO_SIZE:
+            _jd_memo.popitem(last=False)
+    else:
+        _jd_memo.move_to_end(job_desc)
+
+    try:
+        # shield so one cancelled caller does not cancel the shared task
+        parsed = await asyncio.shield(task)
+    except Exception:
+        if _jd_memo.get(job_desc) is task:
+            del _jd_memo[job_desc]
+        raise
+    # only memoise a usable extraction; errors and non-object JSON get retried
+    if (not isinstance(parsed, dict) or "error" in parsed) and _jd_memo.get(job_desc) is task:
+        del _jd_memo[job_desc]
     return {"job_info_json": parsed}
 
 # ----------------------------------------------------
 # NODE: Matching & Scoring
 # ----------------------------------------------------
-def candidate_job_matching(state: State):
+async def candidate_job_matching(state: State):
 
     candidate = state["candidate_info_json"]
     jd = state["job_info_json"]
@@ -275,33 +461,58 @@ def candidate_job_matching(state: State):
     # ------------------ TECH SKILLS (LLM-BASED) ------------------
     cand = candidate
     jd_obj = jd
-    skills_obj = cand.get("skills", {})
-    technical = skills_obj.get("technical", []) or []
-    tools = skills_obj.get("tools", []) or []
+    skills_obj = cand.get("skills") or {}
+    technical = skills_obj.get("technical") or []
+    if isinstance(technical, str):
+        technical = [technical]
+    tools = skills_obj.get("tools") or []
+    if isinstance(tools, str):
+        tools = [tools]
+    # materialised once as a tuple; orjson serialises it as a JSON array
+    candidate_skills = (*technical, *tools)
     payload = {
         "jd_required_skills": jd_obj.get("skills_required", []),
         "jd_optional_skills": jd_obj.get("skills_optional", []),
         "jd_tools": jd_obj.get("tools_and_technologies", []),
         "jd_responsibilities": jd_obj.get("responsibilities", []),
 
-        "candidate_skills": technical + tools,
+        "candidate_skills": candidate_skills,
         "candidate_tools": tools,
 
         "candidate_projects": cand.get("projects", []),
         "candidate_experience": cand.get("experience", []),
         "candidate_certifications": cand.get("certifications", [])
     }
-    response = client.chat.completions.create(
-        model="gpt-oss-20b",
-        messages=[
-            {"role": "system", "content": GRADING_PROMPT},
-            {"role": "user", "content": json.dumps(payload)}
-        ],
-        response_format={"type": "json_object"}
-    )
-    skill_match = json.loads(response.choices[0].message.content)
-    if isinstance(skill_match, list):
-        skill_match = skill_match[0] if skill_match else {}
+
+    async def grade_skills():
+        skill_match = orjson.loads(
+            await _complete_json(_load(GRADING_PROMPT_FILE), orjson.dumps(payload).decode())
+        )
+        if isinstance(skill_match, list):
+            skill_match = skill_match[0] if skill_match else {}
+        return skill_match
+
+    # ------------------ SEMANTIC SKILL OVERLAP ------------------
+    def semantic_overlap():
+        # reported alongside the scores but not weighted into them, so a
+        # failure is logged and reported as None instead of failing the request
+        try:
+            cand_skill_texts = [s for s in candidate_skills if isinstance(s, str)]
+            jd_skill_texts = [
+                s for s in (jd_obj.get("skills_required", []) or []) + (jd_obj.get("tools_and_technologies", []) or [])
+                if isinstance(s, str)
+            ]
+            return compute_semantic_score(cand_skill_texts, jd_skill_texts)
+        except Exception as e:
+            logger.warning("Semantic skill score unavailable: %s", e)
+            return None
+
+    # the grading call waits on the network and the embedding runs on a
+    # worker thread, so neither holds up the other
+    tasks = [grade_skills()]
+    if SEMANTIC_SKILL_SCORE_ENABLED:
+        tasks.append(asyncio.to_thread(semantic_overlap))
+    skill_match, *semantic = await asyncio.gather(*tasks)
     
     skill_score = skill_match.get("final_skill_match_score", 0)
 
@@ -311,12 +522,16 @@ def candidate_job_matching(state: State):
         0.10 * edu_score +
         0.70 * skill_score
     )
-    return {
+    result = {
         "experience_score": exp_score,
         "education_score": edu_score,
         "skill_match_score": skill_match,
         "final_match_score": final_score
     }
+    if semantic:
+        score = semantic[0]
+        result["semantic_skill_score"] = round(score, 3) if score is not None else None
+    return result
 
 # -------------------------------------------------
 # BUILD GRAPH
@@ -325,27 +540,53 @@ graph = StateGraph(State)
 graph.add_node("candidate_json", candidate_info_extraction)
 graph.add_node("jd_json", job_desc_extraction)
 graph.add_node("match_score", candidate_job_matching)
+# candidate and JD extraction only depend on the initial state, so they run
+# as sibling branches and both fan into the matching node
 graph.add_edge(START, "candidate_json")
-graph.add_edge("candidate_json", "jd_json")
+graph.add_edge(START, "jd_json")
+graph.add_edge("candidate_json", "match_score")
 graph.add_edge("jd_json", "match_score")
 graph.add_edge("match_score", END)
 app = graph.compile()
 
+# -------------------------------------------------
+# FAST PATH
+# -------------------------------------------------
+async def run_pipeline(state: State):
+    """Run the graph's nodes directly, skipping LangGraph's per-hop state handling.
+
+    Extraction steps whose output is already present in `state` are skipped,
+    so callers can pre-supply candidate or job JSON.
+    """
+    state = dict(state)
+    pending = []
+    if "candidate_info_json" not in state:
+        pending.append(candidate_info_extraction(state))
+    if "job_info_json" not in state:
+        pending.append(job_desc_extraction(state))
+    for update in await asyncio.gather(*pending):
+        state.update(update)
+    state.update(await candidate_job_matching(state))
+    return state
+
 # -------------------------------------------------
 # EXECUTION
 # -------------------------------------------------
-raw_text, links_info = extract_data("PraveenRaj_CreativeDesigner.pdf")
-job_desc = open("jd.txt", "r").read()
-jd_json = open("jd_json.txt", "r").read()
-initial_state = {
-    "raw_extracted_text": raw_text,
-    "links_info": links_info,
-    "job_description": job_desc
-}
-result = app.invoke(initial_state)
-print(json.dumps(result["candidate_info_json"], indent=2))
-print(json.dumps(result["job_info_json"], indent=2))
-print("Experience Score:", result["experience_score"])
-print("Education Score:", result["education_score"])
-print("Skill Match Score:", json.dumps(result["skill_match_score"], indent=2))
-print("Final Match Score:", result["final_match_score"])
+if __name__ == "__main__":
+    raw_text, links_info = extract_data("PraveenRaj_CreativeDesigner.pdf")
+    job_desc = Path("jd.txt").read_text(encoding="utf-8")
+    jd_json = _load(JD_PROMPT_FILE)
+    initial_state = {
+        "raw_extracted_text": raw_text,
+        "links_info": links_info,
+        "job_description": job_desc
+    }
+    result = asyncio.run(app.ainvoke(initial_state))
+    print(json.dumps(result["candidate_info_json"], indent=2))
+    print(json.dumps(result["job_info_json"], indent=2))
+    print("Experience Score:", result["experience_score"])
+    print("Education Score:", result["education_score"])
+    print("Skill Match Score:", json.dumps(result["skill_match_score"], indent=2))
+    if "semantic_skill_score" in result:
+        print("Semantic Skill Score:", result["semantic_skill_score"])
+    print("Final Match Score:", result["final_match_score"])
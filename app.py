@@ -1,25 +1,40 @@
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import json
 import os
-import tempfile
 from pathlib import Path
 
+# The API runs the embedder from worker threads next to the event loop, so keep
+# torch to one intra-op thread per call unless configured otherwise
+os.environ.setdefault("EMBEDDING_NUM_THREADS", "1")
+
 # Import your existing modules
 from text_extractor import extract_data
 from ResumeParser import (
-    State, client, CANDIDATE_PROMPT, JD_PROMPT, GRADING_PROMPT,
+    State, close_client,
     candidate_info_extraction, job_desc_extraction, candidate_job_matching,
-    graph, app as resume_app
+    graph, run_pipeline
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close pooled OpenRouter connections on shutdown
+    await close_client()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Resume Parser API",
     description="API for parsing resumes and matching them with job descriptions",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -44,12 +59,24 @@ class MatchResult(BaseModel):
     experience_score: float
     education_score: float
     skill_match_score: Dict[str, Any]
+    semantic_skill_score: Optional[float] = None
     final_match_score: float
 
 class ErrorResponse(BaseModel):
     error: str
     detail: Optional[str] = None
 
+# PyMuPDF shares one global MuPDF context and does not support multithreading,
+# so every PDF parse goes through this single worker thread
+_pdf_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-extract")
+
+async def _extract_upload(resume_file: UploadFile):
+    """Extract text and links from an uploaded PDF without touching disk."""
+    content = await resume_file.read()
+    # PyMuPDF parses the bytes directly; run it off the event loop
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pdf_executor, extract_data, content)
+
 # Health check endpoint
 @app.get("/")
 async def root():
@@ -60,7 +87,7 @@ async def health_check():
     return {"status": "healthy", "message": "Resume Parser API is operational"}
 
 # Main resume parsing endpoint
-@app.post("/parse-resume", response_model=MatchResult)
+@app.post("/parse-resume", response_model=MatchResult, response_model_exclude_unset=True)
 async def parse_resume(
     resume_file: UploadFile = File(...),
     job_description: str = Form(...)
@@ -78,40 +105,33 @@ async def parse_resume(
         if not resume_file.filename.endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
         
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            content = await resume_file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Extract data from resume
+        raw_text, links_info = await _extract_upload(resume_file)
+        
+        # Prepare initial state
+        initial_state = {
+            "raw_extracted_text": raw_text,
+            "links_info": links_info,
+            "job_description": job_description
+        }
+        
+        # Run extraction and matching
+        result = await run_pipeline(initial_state)
         
-        try:
-            # Extract data from resume
-            raw_text, links_info = extract_data(temp_file_path)
-            
-            # Prepare initial state
-            initial_state = {
-                "raw_extracted_text": raw_text,
-                "links_info": links_info,
-                "job_description": job_description
-            }
-            
-            # Process through the graph
-            result = resume_app.invoke(initial_state)
-            
-            # Return structured response
-            return MatchResult(
-                candidate_info=result["candidate_info_json"],
-                job_info=result["job_info_json"],
-                experience_score=result.get("experience_score", 0.0),
-                education_score=result.get("education_score", 0.0),
-                skill_match_score=result.get("skill_match_score", {}),
-                final_match_score=result.get("final_match_score", 0.0)
-            )
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+        # Return structured response; the semantic score is only present
+        # when SEMANTIC_SKILL_SCORE is enabled
+        extra = {}
+        if "semantic_skill_score" in result:
+            extra["semantic_skill_score"] = result["semantic_skill_score"]
+        return MatchResult(
+            candidate_info=result["candidate_info_json"],
+            job_info=result["job_info_json"],
+            experience_score=result.get("experience_score", 0.0),
+            education_score=result.get("education_score", 0.0),
+            skill_match_score=result.get("skill_match_score", {}),
+            final_match_score=result.get("final_match_score", 0.0),
+            **extra
+        )
                 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
@@ -133,7 +153,7 @@ async def parse_job_description(job_desc: JobDescription):
         }
         
         # Extract job info
-        job_info = job_desc_extraction(state)
+        job_info = await job_desc_extraction(state)
         
         return {
             "job_info": job_info["job_info_json"],
@@ -158,30 +178,61 @@ async def extract_resume_text(resume_file: UploadFile = File(...)):
         if not resume_file.filename.endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
         
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            content = await resume_file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Extract data from resume
+        raw_text, links_info = await _extract_upload(resume_file)
         
-        try:
-            # Extract data from resume
-            raw_text, links_info = extract_data(temp_file_path)
-            
-            return {
-                "raw_text": raw_text,
-                "links_info": links_info,
-                "message": "Text extracted successfully"
-            }
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+        return {
+            "raw_text": raw_text,
+            "links_info": links_info,
+            "message": "Text extracted successfully"
+        }
                 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error extracting text: {str(e)}")
 
+# Maximum number of resumes processed concurrently in a batch
+MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "8"))
+
+async def _process_one(resume_file: UploadFile, job_description: str, semaphore: asyncio.Semaphore):
+    """Parse a single resume from a batch and score it against the job description."""
+    # Validate file type
+    if not resume_file.filename.endswith('.pdf'):
+        return {
+            "filename": resume_file.filename,
+            "error": "Only PDF files are supported",
+            "success": False
+        }
+    
+    # Upload read and LLM calls both sit behind the semaphore so that memory
+    # and outstanding requests stay bounded
+    async with semaphore:
+        # Extract data from resume
+        raw_text, links_info = await _extract_upload(resume_file)
+        
+        # Prepare initial state
+        initial_state = {
+            "raw_extracted_text": raw_text,
+            "links_info": links_info,
+            "job_description": job_description
+        }
+        
+        # Run extraction and matching
+        result = await run_pipeline(initial_state)
+        
+        item = {
+            "filename": resume_file.filename,
+            "success": True,
+            "candidate_info": result["candidate_info_json"],
+            "job_info": result["job_info_json"],
+            "experience_score": result.get("experience_score", 0.0),
+            "education_score": result.get("education_score", 0.0),
+            "skill_match_score": result.get("skill_match_score", {}),
+            "final_match_score": result.get("final_match_score", 0.0)
+        }
+        if "semantic_skill_score" in result:
+            item["semantic_skill_score"] = result["semantic_skill_score"]
+        return item
+
 # Batch processing endpoint
 @app.post("/batch-parse-resumes")
 async def batch_parse_resumes(
@@ -197,62 +248,20 @@ async def batch_parse_resumes(
     Returns list of matching analyses.
     """
     try:
-        results = []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        tasks = [_process_one(f, job_description, semaphore) for f in resume_files]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for resume_file in resume_files:
-            try:
-                # Validate file type
-                if not resume_file.filename.endswith('.pdf'):
-                    results.append({
-                        "filename": resume_file.filename,
-                        "error": "Only PDF files are supported",
-                        "success": False
-                    })
-                    continue
-                
-                # Save uploaded file temporarily
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                    content = await resume_file.read()
-                    temp_file.write(content)
-                    temp_file_path = temp_file.name
-                
-                try:
-                    # Extract data from resume
-                    raw_text, links_info = extract_data(temp_file_path)
-                    
-                    # Prepare initial state
-                    initial_state = {
-                        "raw_extracted_text": raw_text,
-                        "links_info": links_info,
-                        "job_description": job_description
-                    }
-                    
-                    # Process through the graph
-                    result = resume_app.invoke(initial_state)
-                    
-                    # Add result
-                    results.append({
-                        "filename": resume_file.filename,
-                        "success": True,
-                        "candidate_info": result["candidate_info_json"],
-                        "job_info": result["job_info_json"],
-                        "experience_score": result.get("experience_score", 0.0),
-                        "education_score": result.get("education_score", 0.0),
-                        "skill_match_score": result.get("skill_match_score", {}),
-                        "final_match_score": result.get("final_match_score", 0.0)
-                    })
-                    
-                finally:
-                    # Clean up temporary file
-                    if os.path.exists(temp_file_path):
-                        os.unlink(temp_file_path)
-                        
-            except Exception as e:
+        results = []
+        for resume_file, outcome in zip(resume_files, outcomes):
+            if isinstance(outcome, Exception):
                 results.append({
                     "filename": resume_file.filename,
-                    "error": str(e),
+                    "error": str(outcome),
                     "success": False
                 })
+            else:
+                results.append(outcome)
         
         return {
             "results": results,
@@ -0,0 +1,85 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import numpy as np
+
+class TextEmbeddingCache:
+    """Persistent SQLite cache of sentence embeddings keyed by model and text."""
+
+    def __init__(self, model, model_name, cache_dir="embeddings_cache"):
+        self.model = model
+        self.model_name = model_name
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        # HF fast tokenizers are not safe for concurrent encode calls
+        self._encode_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(cache_dir, "embeddings.sqlite3"),
+            check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _key(self, text):
+        return hashlib.sha1((self.model_name + "\x00" + text).encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys):
+        found = {}
+        with self._lock:
+            # stay well below SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self._conn.execute(
+                    "SELECT key, vector FROM embeddings WHERE key IN (%s)" % ",".join("?" * len(chunk)),
+                    chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def _store(self, items):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, vec.astype(np.float32).tobytes()) for key, vec in items]
+            )
+            self._conn.commit()
+
+    def encode_cached(self, texts, normalize=False):
+        """Encode `texts`, only running the model on strings not seen before.
+
+        Returns a float32 ndarray with one row per input text, in input order.
+        With `normalize=True` each row is scaled to unit length.
+        """
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        keys = [self._key(t) for t in texts]
+        cached = self._lookup(list(set(keys)))
+
+        misses = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in misses:
+                misses[key] = text
+
+        if misses:
+            with self._encode_lock:
+                encoded = self.model.encode(
+                    list(misses.values()),
+                    convert_to_numpy=True,
+                    batch_size=64
+                )
+            new_items = list(zip(misses.keys(), encoded))
+            self._store(new_items)
+            for key, vec in new_items:
+                cached[key] = np.asarray(vec, dtype=np.float32)
+
+        emb = np.stack([cached[key] for key in keys])
+        if normalize:
+            norms = np.linalg.norm(emb, axis=1, keepdims=True)
+            emb = emb / np.maximum(norms, 1e-12)
+        return emb
@@ -0,0 +1,39 @@
+import hashlib
+import os
+import sqlite3
+import threading
+
+class LLMResponseCache:
+    """Persistent SQLite cache of LLM responses keyed by model and prompt."""
+
+    def __init__(self, cache_dir="llm_cache"):
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(cache_dir, "responses.sqlite3"),
+            check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(model, system_prompt, user_content):
+        raw = model + "\x00" + system_prompt + "\x00" + user_content
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, content):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)",
+                (key, content)
+            )
+            self._conn.commit()
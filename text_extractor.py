@@ -1,33 +1,69 @@
 import fitz
 import re
+from urllib.parse import urlsplit
+
+_CLEAN_RE = re.compile(r"[^a-zA-Z0-9'\"\s]")
+_PHONE_RE = re.compile(r'\b\d{10}\b')
+
+# Plain-text extraction without ligature or whitespace preservation. Expanded
+# ligatures survive the cleaning regex, which would otherwise blank the glyphs,
+# and MuPDF's own whitespace normalisation is cheaper than preserving it
+_TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP
+
+# host suffix -> links bucket; anything unmatched is treated as a project link
+_HOST_BUCKETS = {
+    "gmail.com": "mail",
+    "mail.google.com": "mail",
+    "linkedin.com": "linkedin",
+    "medium.com": "medium",
+}
+
+def _classify_uri(uri):
+    try:
+        parts = urlsplit(uri)
+    except ValueError:
+        # malformed annotation such as an unbalanced IPv6 bracket
+        return "projects"
+    if parts.scheme == "mailto":
+        return "mail"
+    host = parts.hostname or ""
+    for suffix, bucket in _HOST_BUCKETS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return bucket
+    return "projects"
 
 def extract_data(pdf_file):
-    doc = fitz.open(pdf_file)
-    text = ""
+    # accept either a path or the raw bytes of an uploaded PDF
+    if isinstance(pdf_file, (bytes, bytearray)):
+        doc = fitz.open(stream=pdf_file, filetype="pdf")
+    else:
+        doc = fitz.open(pdf_file)
+    text_parts = []
+    contacts = []
+    uris = {"mail": [], "linkedin": [], "medium": [], "projects": []}
+    for page in doc:
+        # clean and scan each page as it is read instead of re-walking the
+        # whole document afterwards
+        page_text = _CLEAN_RE.sub(" ", page.get_text("text", flags=_TEXT_FLAGS))
+        text_parts.append(page_text)
+        contacts.extend(_PHONE_RE.findall(page_text))
+        # walk the page's link chain directly; get_links() would build a dict
+        # and resolve the destination of every link, internal ones included
+        link = page.first_link
+        while link:
+            if link.is_external:
+                uris[_classify_uri(link.uri)].append(link.uri)
+            link = link.next
+    doc.close()
+    clean_text = "".join(text_parts)
     links = {
         "profile_info" : {
-            "linkedin" : "", 
-            "mail" : "", 
-            "medium" : "",
-            "contact" : [],
+            "linkedin" : "".join(uris["linkedin"]), 
+            "mail" : "".join(uris["mail"]), 
+            "medium" : "".join(uris["medium"]),
+            "contact" : contacts,
             "location" : "" 
         }, 
-        "projects" : [],
+        "projects" : uris["projects"],
     }
-    for page in doc:
-        text += page.get_text()
-        link_found = page.get_links()
-        for link in link_found:
-            if "gmail" in link["uri"]:
-                links["profile_info"]["mail"] += link["uri"]
-            elif "linkedin" in link["uri"]:
-                links["profile_info"]["linkedin"] += link["uri"]
-            elif "medium" in link["uri"]:
-                links["profile_info"]["medium"] += link["uri"]
-            else:
-                links["projects"].append(link["uri"])
-    clean_text = re.sub(r"[^a-zA-Z0-9'\"\s]", " ", text)
-    for contact in re.findall(r'\b\d{10}\b', clean_text):
-        links["profile_info"]["contact"].append(contact)
-    doc.close()
     return clean_text, links
\ No newline at end of file